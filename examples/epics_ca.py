@@ -12,6 +12,11 @@ from fastcs.transports.epics.ca import EpicsCATransport
 
 from fastcs_secop import SecopController, SecopControllerSettings, SecopQuirks
 
+try:
+    import uvloop  # pyright: ignore[reportMissingImports]
+except ImportError:  # uvloop is optional, and is not available on Windows
+    uvloop = None
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Demo PVA ioc")
     parser.add_argument("-i", "--ip", type=str, default="127.0.0.1", help="IP to connect to")
@@ -21,7 +26,9 @@ if __name__ == "__main__":
     configure_logging(level=LogLevel.DEBUG)
     logging.basicConfig(level=LogLevel.DEBUG)
 
-    asyncio.get_event_loop().slow_callback_duration = 1000
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)  # FastCS schedules its work on the current loop
+    loop.slow_callback_duration = 1000
 
     quirks = SecopQuirks(
         raw_tuple=True,
@@ -46,5 +53,6 @@ if __name__ == "__main__":
     fastcs = FastCS(
         controller,
         [EpicsCATransport()],
+        loop=loop,
     )
     fastcs.run(interactive=True)
@@ -0,0 +1,106 @@
+"""Connection to a SECoP node."""
+
+from collections.abc import AsyncIterator, Sequence
+from logging import getLogger
+
+from fastcs.connections import IPConnection, IPConnectionSettings
+
+logger = getLogger(__name__)
+
+STREAM_LIMIT = 2**20
+"""Maximum length, in bytes, of a single SECoP message.
+
+asyncio's default of 64 KiB is too small for the ``describing`` reply of a large
+SECoP node, or for large blob values.
+"""
+
+
+def split_message(message: str) -> tuple[str, str, str]:
+    """Split a SECoP message into its action, specifier and data parts."""
+    action, _, rest = message.strip().partition(" ")
+    specifier, _, data = rest.partition(" ")
+    return action, specifier, data
+
+
+class SecopConnection(IPConnection):
+    """IP connection to a SECoP node, with support for pipelined queries."""
+
+    async def connect(self, settings: IPConnectionSettings) -> None:
+        """Connect to the SECoP node.
+
+        Args:
+            settings: The IP address and port of the SECoP node.
+
+        """
+        await super().connect(settings)
+        # Ugly, but IPConnection offers no way to pass a limit to open_connection()
+        self._connection.reader._limit = STREAM_LIMIT  # type: ignore  # noqa: SLF001
+
+    async def send_queries(self, messages: Sequence[str]) -> list[str]:
+        """Send several queries in one write, then read one response line per query.
+
+        All messages are written back-to-back before any response is awaited,
+        so that the whole batch costs a single network round-trip.
+
+        Args:
+            messages: The queries to send, each terminated by a newline.
+
+        Returns:
+            The raw response lines, in the order in which they were received.
+
+        """
+        async with self._connection as connection:
+            await connection.send_message("".join(messages))
+            responses = []
+            for message in messages:
+                response = await connection.receive_response()
+                self.log_event(
+                    "Received query response",
+                    query=message.strip(),
+                    response=response.strip(),
+                )
+                responses.append(response)
+            return responses
+
+    async def receive_message(self) -> str:
+        """Wait for the next message sent by the SECoP node.
+
+        This is intended for connections on which asynchronous updates have been
+        :external+secop:doc:`activated <specification/messages/activation>`, where
+        messages arrive without a corresponding query.
+
+        Returns:
+            The raw message line, or an empty string if the connection was closed.
+
+        """
+        async with self._connection as connection:
+            message = await connection.receive_response()
+            self.log_event("Received message", message=message.strip())
+            return message
+
+    async def receive_updates(self) -> AsyncIterator[tuple[str, str, str]]:
+        """Activate asynchronous updates, and yield them as they arrive.
+
+        See :external+secop:doc:`specification/messages/activation` for details.
+        The connection should be dedicated to asynchronous updates, as replies to
+        other queries would be interleaved with the ``update`` messages.
+
+        Yields:
+            The action (``update`` or ``error_update``), specifier
+            (``module:accessible``) and raw data of each update message.
+
+        Raises:
+            ConnectionError: If the SECoP node closes the connection.
+
+        """
+        await self.send_command("activate\n")
+        while True:
+            message = await self.receive_message()
+            if not message:
+                raise ConnectionError("SECoP node closed the asynchronous update connection")
+
+            action, specifier, data = split_message(message)
+            if action not in {"update", "error_update"}:
+                logger.debug("Ignoring asynchronous message: '%s'", message)
+                continue
+            yield action, specifier, data
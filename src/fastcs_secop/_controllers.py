@@ -1,20 +1,23 @@
 """FastCS controllers for SECoP nodes."""
 
 import asyncio
+import contextlib
 import dataclasses
+import itertools
 import typing
-import uuid
 from logging import getLogger
 
 import orjson
 from fastcs.attributes import AttrR, AttrRW
 from fastcs.connections import IPConnection, IPConnectionSettings
 from fastcs.controllers import Controller
-from fastcs.methods import command, scan
+from fastcs.methods import Scan, command, scan
 
+from fastcs_secop._connection import SecopConnection
 from fastcs_secop._io import (
     SecopAttributeIO,
     SecopAttributeIORef,
+    SecopBatchPoller,
     SecopRawAttributeIO,
     SecopRawAttributeIORef,
     decode,
@@ -24,6 +27,13 @@ from fastcs_secop._util import SecopError, SecopQuirks, is_raw, secop_datainfo_t
 
 logger = getLogger(__name__)
 
+_SECOP_MANUFACTURERS = frozenset(
+    {
+        "ISSE&SINE2020",  # SECOP 1.x
+        "ISSE",  # SECOP 2.x
+    }
+)
+
 
 @dataclasses.dataclass
 class SecopControllerSettings:
@@ -209,13 +219,11 @@ class SecopModuleController(Controller):
                 io_ref = SecopRawAttributeIORef(
                     module_name=self._module_name,
                     accessible_name=parameter_name,
-                    update_period=self._quirks.update_period,
                 )
             else:
                 io_ref = SecopAttributeIORef(
                     module_name=self._module_name,
                     accessible_name=parameter_name,
-                    update_period=self._quirks.update_period,
                     datainfo=datainfo,
                 )
 
@@ -278,8 +286,13 @@ class SecopController(Controller):
 
         """
         self._ip_settings = settings.connection
-        self._connection = IPConnection()
+        self._connection = SecopConnection()
+        self._update_connection = SecopConnection()
         self._quirks = settings.quirks or SecopQuirks()
+        self._poller = SecopBatchPoller(connection=self._connection)
+        self._ping_tokens = itertools.count(1)
+        self._initialised = asyncio.Event()
+        self._update_task: asyncio.Task[None] | None = None
 
         super().__init__()
 
@@ -292,6 +305,14 @@ class SecopController(Controller):
             logger.error("Failed to (re-)connect to SECoP node due to %s", e)
             self._connected = False
 
+    async def disconnect(self) -> None:
+        """Stop receiving asynchronous updates, and close the connection to the SECoP node."""
+        if self._update_task is not None:
+            self._update_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._update_task
+        await self._connection.close()
+
     async def reconnect(self) -> None:
         if self._connected:
             return
@@ -307,9 +328,10 @@ class SecopController(Controller):
     @scan(15.0)
     async def ping(self) -> None:
         """Ping the SECoP device, to check connection is still open."""
-        token = uuid.uuid4()
+        token = next(self._ping_tokens)
         response = await self._connection.send_query(f"ping {token}\n")
-        if not response.startswith(f"pong {token}"):
+        # The data report after the token is optional.
+        if response.strip().split(" ", 2)[:2] != ["pong", str(token)]:
             raise SecopError(
                 f"Unexpected response to SECoP ping (token={token}, response={response})"
             )
@@ -332,10 +354,7 @@ class SecopController(Controller):
         except ValueError as e:
             raise SecopError("Invalid response to '*IDN?'") from e
 
-        if manufacturer not in {
-            "ISSE&SINE2020",  # SECOP 1.x
-            "ISSE",  # SECOP 2.x
-        }:
+        if manufacturer not in _SECOP_MANUFACTURERS:
             raise SecopError(
                 f"Device responded to '*IDN?' with bad manufacturer string '{manufacturer}'. "
                 f"Not a SECoP device?"
@@ -358,10 +377,15 @@ class SecopController(Controller):
         in this SECoP node.
 
         A subcontroller of type :py:obj:`SecopModuleController` is added for
-        each discovered module.
+        each discovered module. All readable parameters are then polled together,
+        every :py:obj:`~fastcs_secop.SecopQuirks.update_period` seconds, using a
+        single pipelined batch of ``read`` requests. Alternatively, if
+        :py:obj:`~fastcs_secop.SecopQuirks.asynchronous_updates` is set, parameters
+        are updated by asynchronous messages received on a second connection.
 
         This controller attempts to periodically reconnect to the device if the
-        connection was closed, and disables asynchronous messages on instantiation.
+        connection was closed, and disables asynchronous messages on the main
+        connection on instantiation.
 
         Raises:
             SecopError: if the device is not a SECoP device, if a reply in an
@@ -373,17 +397,29 @@ class SecopController(Controller):
         if not self._connected:
             raise SecopError("Could not connect to SECoP node at FastCS startup")
         await self.check_idn()
-        await self.deactivate()
-        await self._create_modules()
+        # deactivate and describe are pipelined, saving a round-trip at startup.
+        _, describing = await self._connection.send_queries(["deactivate\n", "describe\n"])
+        await self._create_modules(describing)
+        if self._quirks.asynchronous_updates:
+            await self._create_update_task()
+        else:
+            # Scans share a namespace with sub controllers. SECoP module names start
+            # with a letter, so this name cannot clash with a module.
+            self.add_scan("_poll", Scan(self._poller.poll, self._quirks.update_period))
         await self._create_reconnect_task()
+        self._initialised.set()
+
+    async def _create_modules(self, response: str) -> None:
+        """Create subcontrollers for each SECoP module.
 
-    async def _create_modules(self) -> None:
-        """Create subcontrollers for each SECoP module."""
-        descriptor = await self._connection.send_query("describe\n")
-        if not descriptor.startswith("describing . "):
-            raise SecopError(f"Invalid response to 'describe': '{descriptor}'.")
+        Args:
+            response: The SECoP node's reply to ``describe``.
+
+        """
+        if not response.startswith("describing . "):
+            raise SecopError(f"Invalid response to 'describe': '{response}'.")
 
-        descriptor = orjson.loads(descriptor[len("describing . ") :])
+        descriptor = orjson.loads(response[len("describing . ") :])
 
         description = descriptor["description"]
         equipment_id = descriptor["equipment_id"]
@@ -395,19 +431,28 @@ class SecopController(Controller):
 
         modules = descriptor["modules"]
 
+        module_controllers: dict[str, SecopModuleController] = {}
         for module_name, module in modules.items():
             if module_name in self._quirks.skip_modules:
                 continue
             logger.debug("Creating subcontroller for module %s", module_name)
-            module_controller = SecopModuleController(
+            module_controllers[module_name] = SecopModuleController(
                 connection=self._connection,
                 module_name=module_name,
                 module=module,
                 quirks=self._quirks,
             )
-            await module_controller.initialise()
+
+        await asyncio.gather(*(c.initialise() for c in module_controllers.values()))
+
+        # Added serially, so that modules keep the order in which the node describes them.
+        for module_name, module_controller in module_controllers.items():
             self.add_sub_controller(name=module_name, sub_controller=module_controller)
 
+            # All attributes of a module controller are readable SECoP parameters.
+            for attr in module_controller.attributes.values():
+                self._poller.add(typing.cast(AttrR[typing.Any, typing.Any], attr))
+
     async def _create_reconnect_task(self) -> None:
         """Schedule a reconnection attempt every 15 seconds."""
 
@@ -417,3 +462,28 @@ class SecopController(Controller):
                 await asyncio.sleep(15)
 
         self._reconnect_task = asyncio.create_task(_reconnect_task())
+
+    async def _receive_updates(self) -> None:
+        """Connect a second time to the SECoP node, and apply asynchronous updates."""
+        try:
+            await self._update_connection.connect(self._ip_settings)
+            async for action, specifier, data in self._update_connection.receive_updates():
+                if action == "error_update":
+                    self._poller.apply_error(specifier, data)
+                else:
+                    await self._poller.apply(specifier, data)
+        except Exception as e:
+            logger.error("Asynchronous update connection to SECoP node failed due to %s", e)
+        finally:
+            with contextlib.suppress(OSError):
+                await self._update_connection.close()
+
+    async def _create_update_task(self) -> None:
+        """Receive asynchronous updates, reconnecting every 15 seconds if they stop."""
+
+        async def _update_task() -> None:
+            while True:
+                await self._receive_updates()
+                await asyncio.sleep(15)
+
+        self._update_task = asyncio.create_task(_update_task())
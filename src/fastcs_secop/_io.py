@@ -1,10 +1,15 @@
 """Implementation of IO for SECoP accessibles."""
 
 import base64
+import binascii
 import enum
+import functools
+import math
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
-from logging import getLogger
+from logging import DEBUG, ERROR, getLogger
 from typing import Any, TypeAlias, cast
 
 import numpy as np
@@ -13,6 +18,7 @@ import orjson
 from fastcs.attributes import AttributeIO, AttributeIORef, AttrR, AttrW
 from fastcs.connections import IPConnection
 
+from fastcs_secop._connection import SecopConnection, split_message
 from fastcs_secop._util import (
     SecopError,
     secop_dtype_to_numpy_dtype,
@@ -23,17 +29,55 @@ from fastcs_secop._util import (
 logger = getLogger(__name__)
 
 
+ERROR_LOG_INTERVAL = 1.0
+"""Minimum interval, in seconds, between error logs for the same accessible.
+
+Further errors within this interval are logged at debug level instead.
+"""
+
 T: TypeAlias = int | float | str | bool | Enum | npt.NDArray[Any]  # noqa: UP040 (sphinx doesn't like it)
 """Generic type parameter for SECoP IO."""
 
 
-async def secop_read(connection: IPConnection, module_name: str, accessible_name: str) -> str:
+@dataclass
+class SecopAccessibleIORef(AttributeIORef):
+    """Common AttributeIO parameters for a SECoP accessible."""
+
+    module_name: str = ""
+    accessible_name: str = ""
+
+    @functools.cached_property
+    def specifier(self) -> str:
+        """The SECoP specifier, ``module:accessible``, of this accessible."""
+        return f"{self.module_name}:{self.accessible_name}"
+
+    @functools.cached_property
+    def read_query(self) -> str:
+        """The ``read`` request for this accessible."""
+        return f"read {self.specifier}\n"
+
+    @functools.cached_property
+    def change_query_prefix(self) -> str:
+        """The start of a ``change`` request for this accessible, up to the value."""
+        return f"change {self.specifier} "
+
+    @functools.cached_property
+    def read_prefix(self) -> str:
+        """Prefix of a successful reply to a ``read`` of this accessible."""
+        return f"reply {self.specifier} "
+
+    @functools.cached_property
+    def change_prefix(self) -> str:
+        """Prefix of a successful reply to a ``change`` of this accessible."""
+        return f"changed {self.specifier} "
+
+
+async def secop_read(connection: IPConnection, io_ref: SecopAccessibleIORef) -> str:
     """Read a SECoP accessible.
 
     Args:
         connection: Connection reference,
-        module_name: Module name
-        accessible_name: Accessible name
+        io_ref: Reference to the accessible to read.
 
     Returns:
         The result of reading from the accessible, after JSON deserialisation.
@@ -42,11 +86,10 @@ async def secop_read(connection: IPConnection, module_name: str, accessible_name
         SecopError: If a valid response was not received
 
     """
-    query = f"read {module_name}:{accessible_name}\n"
-    response = await connection.send_query(query)
+    response = await connection.send_query(io_ref.read_query)
     response = response.strip()
 
-    prefix = f"reply {module_name}:{accessible_name} "
+    prefix = io_ref.read_prefix
     if not response.startswith(prefix):
         raise SecopError(f"Invalid response to 'read' command by SECoP device: '{response}'")
 
@@ -54,86 +97,153 @@ async def secop_read(connection: IPConnection, module_name: str, accessible_name
 
 
 async def secop_change(
-    connection: IPConnection, module_name: str, accessible_name: str, encoded_value: str
+    connection: IPConnection, io_ref: SecopAccessibleIORef, encoded_value: str
 ) -> None:
     """Change a SECoP accessible.
 
     Args:
         connection: Connection reference,
-        module_name: Module name
-        accessible_name: Accessible name
+        io_ref: Reference to the accessible to change.
         encoded_value: Value to set (as a raw string ready for transport).
 
     Raises:
         SecopError: If a valid response was not received
 
     """
-    query = f"change {module_name}:{accessible_name} {encoded_value}\n"
+    query = f"{io_ref.change_query_prefix}{encoded_value}\n"
 
     response = await connection.send_query(query)
     response = response.strip()
 
-    prefix = f"changed {module_name}:{accessible_name} "
-
-    if not response.startswith(prefix):
+    if not response.startswith(io_ref.change_prefix):
         raise SecopError(f"Invalid response to 'change' command by SECoP device: '{response}'")
 
 
 @dataclass
-class SecopAttributeIORef(AttributeIORef):
+class SecopAttributeIORef(SecopAccessibleIORef):
     """AttributeIO parameters for a SECoP parameter (accessible)."""
 
-    module_name: str = ""
-    accessible_name: str = ""
     datainfo: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
-class SecopRawAttributeIORef(AttributeIORef):
+class SecopRawAttributeIORef(SecopAccessibleIORef):
     """RawAttributeIO parameters for a SECoP parameter (accessible)."""
 
-    module_name: str = ""
-    accessible_name: str = ""
 
+def make_decoder(datainfo: dict[str, Any], attr: AttrR[T]) -> Callable[[str], T]:
+    """Make a decoder for the transported values of a SECoP parameter.
 
-def decode(raw_value: str, datainfo: dict[str, Any], attr: AttrR[T]) -> T:  # noqa ANN401
-    """Decode the transported value into a python datatype.
+    Everything which depends only on the ``datainfo`` (scale, numpy dtypes, ...)
+    is worked out once here, rather than on every decode.
 
     Args:
-        value: The value to decode (the raw transported string)
         datainfo: The SECoP ``datainfo`` dictionary for this attribute.
+        attr: The attribute which the decoded values are for.
 
     Returns:
-        Python datatype representation of the transported value.
+        A function converting a value (the raw transported string) into a python datatype.
 
     """
-    value, *_ = orjson.loads(raw_value)
     match datainfo["type"]:
         case "enum":
-            return attr.dtype(cast(int, value))
+            enum_type = attr.dtype
+
+            def decode_enum(raw_value: str) -> T:
+                return enum_type(cast(int, orjson.loads(raw_value)[0]))
+
+            return decode_enum
         case "scaled":
-            return value * datainfo["scale"]
+            scale = datainfo["scale"]
+
+            def decode_scaled(raw_value: str) -> T:
+                return orjson.loads(raw_value)[0] * scale
+
+            return decode_scaled
         case "blob":
-            return np.frombuffer(base64.b64decode(value), dtype=np.uint8)
+
+            def decode_blob(raw_value: str) -> T:
+                value = orjson.loads(raw_value)[0]
+                return np.frombuffer(binascii.a2b_base64(value), dtype=np.uint8)
+
+            return decode_blob
         case "array":
             inner_np_dtype = secop_dtype_to_numpy_dtype(datainfo["members"])
-            return np.array(value, dtype=inner_np_dtype)
+
+            def decode_array(raw_value: str) -> T:
+                return np.array(orjson.loads(raw_value)[0], dtype=inner_np_dtype)
+
+            return decode_array
         case "tuple":
-            structured_np_dtype = tuple_structured_dtype(datainfo)
-            return np.array([tuple(value)], dtype=structured_np_dtype)
+            tuple_np_dtype = np.dtype(tuple_structured_dtype(datainfo))
+
+            def decode_tuple(raw_value: str) -> T:
+                return np.array([tuple(orjson.loads(raw_value)[0])], dtype=tuple_np_dtype)
+
+            return decode_tuple
         case "struct":
-            structured_np_dtype = struct_structured_dtype(datainfo)
-            arr = np.zeros(shape=(1,), dtype=structured_np_dtype)
-            for k, v in cast(dict[str, Any], value).items():
-                arr[0][k] = v
-            return arr
+            struct_np_dtype = np.dtype(struct_structured_dtype(datainfo))
+            member_names = tuple(datainfo["members"])
+
+            def decode_struct(raw_value: str) -> T:
+                value = cast(dict[str, Any], orjson.loads(raw_value)[0])
+                try:
+                    return np.array([tuple(value[k] for k in member_names)], dtype=struct_np_dtype)
+                except KeyError:
+                    # Optional members may be omitted - leave those zeroed.
+                    arr = np.zeros(shape=(1,), dtype=struct_np_dtype)
+                    for k, v in value.items():
+                        arr[0][k] = v
+                    return arr
+
+            return decode_struct
         case "matrix":
-            lengths = value["len"][::-1]
-            return np.frombuffer(
-                base64.b64decode(value["blob"]), dtype=datainfo["elementtype"]
-            ).reshape(lengths)
+            element_np_dtype = np.dtype(datainfo["elementtype"])
+
+            def decode_matrix(raw_value: str) -> T:
+                value = orjson.loads(raw_value)[0]
+                return np.frombuffer(
+                    binascii.a2b_base64(value["blob"]), dtype=element_np_dtype
+                ).reshape(value["len"][::-1])
+
+            return decode_matrix
         case _:
-            return value
+
+            def decode_value(raw_value: str) -> T:
+                return orjson.loads(raw_value)[0]
+
+            return decode_value
+
+
+def decode(raw_value: str, datainfo: dict[str, Any], attr: AttrR[T]) -> T:
+    """Decode the transported value into a python datatype.
+
+    To decode many values for the same attribute, prefer :py:obj:`make_decoder`.
+
+    Args:
+        raw_value: The value to decode (the raw transported string)
+        datainfo: The SECoP ``datainfo`` dictionary for this attribute.
+        attr: The attribute which the decoded value is for.
+
+    Returns:
+        Python datatype representation of the transported value.
+
+    """
+    return make_decoder(datainfo, attr)(raw_value)
+
+
+def decode_raw(raw_value: str) -> str:
+    """Decode the transported value into a JSON string, for raw-mode attributes.
+
+    Args:
+        raw_value: The value to decode (the raw transported string)
+
+    Returns:
+        The JSON representation of the value, without timestamp or other qualifiers.
+
+    """
+    value = orjson.loads(raw_value)[0]
+    return orjson.dumps(value).decode()
 
 
 def encode(value: T, datainfo: dict[str, Any]) -> str:
@@ -187,24 +297,11 @@ class SecopAttributeIO(AttributeIO[T, SecopAttributeIORef]):
 
         self._connection = connection
 
-    async def update(self, attr: AttrR[T, SecopAttributeIORef]) -> None:
-        """Read value from device and update the value in FastCS."""
-        raw_value = await secop_read(
-            self._connection, attr.io_ref.module_name, attr.io_ref.accessible_name
-        )
-        value = decode(raw_value, attr.io_ref.datainfo, attr)
-        await attr.update(value)
-
     async def send(self, attr: AttrW[T, SecopAttributeIORef], value: T) -> None:
         """Send a value from FastCS to the device."""
         try:
             encoded_value = encode(value, attr.io_ref.datainfo)
-            await secop_change(
-                self._connection,
-                attr.io_ref.module_name,
-                attr.io_ref.accessible_name,
-                encoded_value,
-            )
+            await secop_change(self._connection, attr.io_ref, encoded_value)
             # Ugly, but I can't find a public alternative...
             # https://github.com/DiamondLightSource/FastCS/pull/292
             await attr._call_sync_setpoint_callbacks(value)  # noqa: SLF001
@@ -232,24 +329,10 @@ class SecopRawAttributeIO(AttributeIO[str, SecopRawAttributeIORef]):
 
         self._connection = connection
 
-    async def update(self, attr: AttrR[str, SecopRawAttributeIORef]) -> None:
-        """Read value from device and update the value in FastCS."""
-        raw_value = await secop_read(
-            self._connection, attr.io_ref.module_name, attr.io_ref.accessible_name
-        )
-        # Get rid of timestamp and other specifiers, we just want the value
-        value, *_ = orjson.loads(raw_value)
-        await attr.update(orjson.dumps(value).decode())
-
     async def send(self, attr: AttrW[str, SecopRawAttributeIORef], value: str) -> None:
         """Send a value from FastCS to the device."""
         try:
-            await secop_change(
-                self._connection,
-                attr.io_ref.module_name,
-                attr.io_ref.accessible_name,
-                value,
-            )
+            await secop_change(self._connection, attr.io_ref, value)
             # Ugly, but I can't find a public alternative...
             # https://github.com/DiamondLightSource/FastCS/pull/292
             await attr._call_sync_setpoint_callbacks(value)  # noqa: SLF001
@@ -258,3 +341,147 @@ class SecopRawAttributeIO(AttributeIO[str, SecopRawAttributeIORef]):
             pass
         except Exception as e:
             logger.error("Exception during send() for %s: %s: %s", attr, e.__class__.__name__, e)
+
+
+@dataclass
+class _PolledAccessible:
+    io_ref: SecopAccessibleIORef
+    attr: AttrR[Any, Any]
+    decoder: Callable[[str], Any]
+
+
+class SecopBatchPoller:
+    """Poll many SECoP accessibles using a single pipelined batch of ``read`` requests.
+
+    Rather than paying one network round-trip per accessible, all ``read``
+    requests are written to the connection at once and the replies are then
+    dispatched to their attributes by specifier.
+    """
+
+    def __init__(self, *, connection: SecopConnection) -> None:
+        """Poller for SECoP accessibles.
+
+        Args:
+            connection: The connection to use.
+
+        """
+        self._connection = connection
+        self._queries: list[str] = []
+        self._accessibles: dict[str, _PolledAccessible] = {}
+        self._last_error_times: dict[str, float] = {}
+
+    def add(self, attr: AttrR[Any, Any]) -> None:
+        """Add an attribute to be updated on each poll.
+
+        Args:
+            attr: The attribute to update. Its :py:obj:`SecopAttributeIORef` or
+                :py:obj:`SecopRawAttributeIORef` determines which accessible is read,
+                and how the reply is decoded.
+
+        """
+        io_ref = attr.io_ref
+        if isinstance(io_ref, SecopAttributeIORef):
+            decoder = make_decoder(io_ref.datainfo, attr)
+        else:
+            decoder = decode_raw
+
+        self._queries.append(io_ref.read_query)
+        self._accessibles[io_ref.specifier] = _PolledAccessible(
+            io_ref=io_ref,
+            attr=attr,
+            decoder=decoder,
+        )
+
+    async def poll(self) -> None:
+        """Read all accessibles in a single batch and update their attributes.
+
+        An ``error_read`` reply is logged as that accessible's result for this poll.
+        Any accessible which did not receive a reply in the batch is read again
+        individually. Errors reading or decoding a single accessible are logged
+        rather than raised, so that one bad accessible cannot stop the others from
+        updating.
+
+        """
+        if not self._queries:
+            return
+
+        responses = await self._connection.send_queries(self._queries)
+
+        pending = dict(self._accessibles)
+        for response in responses:
+            action, specifier, raw_value = split_message(response)
+            if action == "reply" and specifier in pending:
+                await self._update(specifier, pending.pop(specifier), raw_value)
+            elif action == "error_read" and specifier in pending:
+                del pending[specifier]
+                self.apply_error(specifier, raw_value)
+            else:
+                logger.debug("Unexpected response in batch read: '%s'", response)
+
+        for specifier, polled in pending.items():
+            try:
+                raw_value = await secop_read(self._connection, polled.io_ref)
+            except SecopError as e:
+                self._log_error(specifier, e)
+                continue
+            await self._update(specifier, polled, raw_value)
+
+    async def apply(self, specifier: str, raw_value: str) -> None:
+        """Decode a value received for an accessible, and update its attribute.
+
+        This is used to apply asynchronous ``update`` messages. Errors are logged
+        rather than raised, so that one bad value cannot stop further updates.
+
+        Args:
+            specifier: The SECoP specifier (``module:accessible``) of the accessible.
+            raw_value: The raw transported value.
+
+        """
+        polled = self._accessibles.get(specifier)
+        if polled is None:
+            logger.debug("Ignoring value for unknown accessible %s", specifier)
+            return
+
+        await self._update(specifier, polled, raw_value)
+
+    def apply_error(self, specifier: str, error_report: str) -> None:
+        """Log an error report received from the SECoP node for an accessible.
+
+        This is used for ``error_read`` replies, and for asynchronous
+        ``error_update`` messages. Errors are logged at most once per interval
+        for each accessible.
+
+        Args:
+            specifier: The SECoP specifier (``module:accessible``) of the accessible.
+            error_report: The raw error report.
+
+        """
+        if specifier not in self._accessibles:
+            logger.debug("Ignoring error for unknown accessible %s", specifier)
+            return
+
+        self._log_error(specifier, SecopError(f"Error report: {error_report}"))
+
+    async def _update(self, specifier: str, polled: _PolledAccessible, raw_value: str) -> None:
+        """Decode a raw value and update its attribute, logging any error."""
+        try:
+            await polled.attr.update(polled.decoder(raw_value))
+        except Exception as e:
+            self._log_error(specifier, e)
+
+    def _log_error(self, specifier: str, e: Exception) -> None:
+        logger.log(
+            self._error_log_level(specifier),
+            "Failed to update %s: %s: %s",
+            specifier,
+            e.__class__.__name__,
+            e,
+        )
+
+    def _error_log_level(self, specifier: str) -> int:
+        """Log level for an error on an accessible, limiting errors to one per interval."""
+        now = time.monotonic()
+        if now - self._last_error_times.get(specifier, -math.inf) < ERROR_LOG_INTERVAL:
+            return DEBUG
+        self._last_error_times[specifier] = now
+        return ERROR
@@ -1,4 +1,6 @@
 import enum
+import functools
+import re
 import typing
 from collections.abc import Collection
 from dataclasses import dataclass, field
@@ -21,6 +23,15 @@ class SecopQuirks:
     update_period: float = 1.0
     """Update period, in seconds."""
 
+    asynchronous_updates: bool = False
+    """Receive parameter updates asynchronously, rather than polling.
+
+    If enabled, a second connection to the SECoP node is
+    :external+secop:doc:`activated <specification/messages/activation>`, and the
+    node then sends an ``update`` message whenever a parameter changes. Parameters
+    are not polled in this mode, so :py:obj:`update_period` is ignored.
+    """
+
     skip_modules: Collection[str] = field(default_factory=list)
     """Skip creating any listed modules."""
 
@@ -77,29 +88,36 @@ class SecopError(Exception):
     """Error raised to identify a SECoP protocol or configuration problem."""
 
 
+_FIXED_POINT_FORMAT = re.compile(r"%\.(\d+)f")
+
+
+@functools.lru_cache(maxsize=256)
 def format_string_to_prec(fmt_str: str | None) -> int | None:
     """Convert a SECoP format-string specifier to a precision."""
     if fmt_str is None:
         return None
 
-    if fmt_str.startswith("%.") and fmt_str.endswith("f"):
-        return int(fmt_str[2:-1])
+    match = _FIXED_POINT_FORMAT.fullmatch(fmt_str)
+    if match is not None:
+        return int(match.group(1))
 
     return None
 
 
-def secop_dtype_to_numpy_dtype(secop_datainfo: dict[str, Any]) -> npt.DTypeLike:
+_NUMPY_DTYPES: dict[str, np.dtype[Any]] = {
+    "double": np.dtype(np.float64),
+    "int": np.dtype(np.int32),
+    "bool": np.dtype(np.uint8),  # CA transport doesn't support bool_
+    "enum": np.dtype(np.int32),
+}
+
+
+def secop_dtype_to_numpy_dtype(secop_datainfo: dict[str, Any]) -> np.dtype[Any]:
     dtype = secop_datainfo["type"]
-    if dtype == "double":
-        return np.float64
-    elif dtype == "int":
-        return np.int32
-    elif dtype == "bool":
-        return np.uint8  # CA transport doesn't support bool_
-    elif dtype == "enum":
-        return np.int32
+    if dtype in _NUMPY_DTYPES:
+        return _NUMPY_DTYPES[dtype]
     elif dtype == "string":
-        return f"<U{secop_datainfo.get('maxchars', 65536)}"
+        return np.dtype(f"<U{secop_datainfo.get('maxchars', 65536)}")
     else:
         raise SecopError(
             f"Cannot handle SECoP dtype '{secop_datainfo['type']}' within array/struct/tuple"
@@ -117,6 +135,29 @@ def struct_structured_dtype(datainfo: dict[str, Any]) -> list[tuple[str, npt.DTy
     return [(k, secop_dtype_to_numpy_dtype(v)) for k, v in datainfo["members"].items()]
 
 
+# FastCS datatypes are frozen, so identical ones can be shared between attributes.
+_RAW_STRING = String(2048)
+_BOOL = Bool()
+_STRING = String()
+
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _float_dtype(
+    units: str | None, min_alarm: float | None, max_alarm: float | None, prec: int | None
+) -> Float:
+    return Float(units=units, min_alarm=min_alarm, max_alarm=max_alarm, prec=prec)  # type: ignore
+
+
+@functools.lru_cache(maxsize=512, typed=True)
+def _int_dtype(units: str | None, min_alarm: int | None, max_alarm: int | None) -> Int:
+    return Int(units=units, min_alarm=min_alarm, max_alarm=max_alarm)
+
+
+@functools.lru_cache(maxsize=128)
+def _enum_dtype(members: tuple[tuple[str, int], ...]) -> Enum[Any]:
+    return Enum(enum.Enum("GeneratedSecopEnum", members))
+
+
 def secop_datainfo_to_fastcs_dtype(datainfo: dict[str, Any], raw: bool = False) -> DataType[Any]:
     """Convert a SECoP datainfo dictionary to a FastCS data type.
 
@@ -126,7 +167,7 @@ def secop_datainfo_to_fastcs_dtype(datainfo: dict[str, Any], raw: bool = False)
 
     """
     if raw:
-        return String(2048)
+        return _RAW_STRING
 
     min_val = datainfo.get("min")
     max_val = datainfo.get("max")
@@ -140,25 +181,20 @@ def secop_datainfo_to_fastcs_dtype(datainfo: dict[str, Any], raw: bool = False)
             if max_val is not None and scale is not None:
                 max_val *= scale
 
-            return Float(
-                units=datainfo.get("unit", None),
-                min_alarm=min_val,
-                max_alarm=max_val,
-                prec=format_string_to_prec(datainfo.get("fmtstr", None)),  # type: ignore
+            return _float_dtype(
+                datainfo.get("unit", None),
+                min_val,
+                max_val,
+                format_string_to_prec(datainfo.get("fmtstr", None)),
             )
         case "int":
-            return Int(
-                units=datainfo.get("unit", None),
-                min_alarm=min_val,
-                max_alarm=max_val,
-            )
+            return _int_dtype(datainfo.get("unit", None), min_val, max_val)
         case "bool":
-            return Bool()
+            return _BOOL
         case "enum":
-            enum_type = enum.Enum("GeneratedSecopEnum", datainfo["members"])
-            return Enum(enum_type)
+            return _enum_dtype(tuple(datainfo["members"].items()))
         case "string":
-            return String()
+            return _STRING
         case "blob":
             return Waveform(np.uint8, shape=(datainfo["maxbytes"],))
         case "array":
@@ -1,11 +1,17 @@
-import json
 import time
 import typing
 
+import orjson
 from lewis.adapters.stream import StreamInterface
 from lewis.core.logging import has_log
 from lewis.utils.command_builder import CmdBuilder
 
+from ..device import Parameter
+
+
+def _dumps(value: typing.Any) -> str:
+    return orjson.dumps(value).decode()
+
 
 @has_log
 class SimpleSecopStreamInterface(StreamInterface):
@@ -21,7 +27,7 @@ class SimpleSecopStreamInterface(StreamInterface):
         .escape(":")
         .any_except(" ")
         .escape(" ")
-        .arg(".*", argument_mapping=json.loads)
+        .arg(".*", argument_mapping=orjson.loads)
         .optional("\r")
         .eos()
         .build(),
@@ -48,22 +54,30 @@ class SimpleSecopStreamInterface(StreamInterface):
         return "ISSE&SINE2020,SECoP,V0000.00.00,lewis_emulator"
 
     def ping(self, token):
-        return f"pong {token} {json.dumps([None, {'t': time.time()}])}"
+        return f"pong {token} {_dumps([None, {'t': time.time()}])}"
 
     def describe(self):
-        return f"describing . {json.dumps(self._device.descriptor())}"
+        return f"describing . {_dumps(self._device.descriptor())}"
 
     def change(self, module: str, accessible: str, value: typing.Any):
         self._device.modules[module].accessibles[accessible].change(value)
         data_report = self._device.modules[module].accessibles[accessible].data_report()
-        return f"changed {module}:{accessible} {json.dumps(data_report)}"
+        return f"changed {module}:{accessible} {_dumps(data_report)}"
 
     def read(self, module: str, accessible: str):
         data_report = self._device.modules[module].accessibles[accessible].data_report()
-        return f"reply {module}:{accessible} {json.dumps(data_report)}"
+        return f"reply {module}:{accessible} {_dumps(data_report)}"
 
     def deactivate(self):
         return "inactive"
 
     def activate(self):
-        raise ValueError("emulator does not (yet) support sending asynchronous updates.")
+        # Initial values of all parameters, then "active". Subsequent changes are
+        # not (yet) sent as asynchronous updates.
+        updates = [
+            f"update {module_name}:{name} {_dumps(accessible.data_report())}"
+            for module_name, module in self._device.modules.items()
+            for name, accessible in module.accessibles.items()
+            if isinstance(accessible, Parameter)
+        ]
+        return "\n".join([*updates, "active"])
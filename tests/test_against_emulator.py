@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import math
 import os.path
 import subprocess
@@ -12,13 +13,20 @@ from fastcs.attributes import AttrR
 from fastcs.connections import IPConnectionSettings
 from fastcs.logging import LogLevel, configure_logging
 
-from fastcs_secop import SecopController, SecopControllerSettings
+from fastcs_secop import SecopController, SecopControllerSettings, SecopQuirks
 
 configure_logging(level=LogLevel.TRACE)
 
 
-@pytest.fixture(scope="class")
-def emulator():
+@pytest.fixture(scope="session")
+def emulator_port() -> int:
+    # One emulator per pytest-xdist worker ("gw0", "gw1", ...), each on its own port.
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return 57677 + int(worker.removeprefix("gw"))
+
+
+@pytest.fixture(scope="session")
+def emulator(emulator_port):
     proc = subprocess.Popen(
         [
             sys.executable,
@@ -28,7 +36,7 @@ def emulator():
             "emulators",
             "simple_secop",
             "-p",
-            "stream: {bind_address: 127.0.0.1, port: 57677}",
+            f"stream: {{bind_address: 127.0.0.1, port: {emulator_port}}}",
         ],
         cwd=os.path.dirname(__file__),
         stdout=sys.stdout,
@@ -40,25 +48,38 @@ def emulator():
         proc.kill()
 
 
+async def _await_port(host: str, port: int) -> None:
+    """Wait until something is listening on a TCP port, backing off between attempts."""
+    delay = 0.005
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.1)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return
+
+
 @pytest.fixture
-async def controller():
+async def controller(request, emulator_port):
     controller = SecopController(
         SecopControllerSettings(
             connection=IPConnectionSettings(
                 ip="127.0.0.1",
-                port=57677,
-            )
+                port=emulator_port,
+            ),
+            quirks=getattr(request, "param", None),
         ),
     )
 
-    for _ in range(100):
-        await controller.connect()
-        if controller._connected:
-            break
-        else:
-            await asyncio.sleep(0.1)
-    else:
-        raise RuntimeError("Could not connect to emulator within 10s")
+    async with asyncio.timeout(10):
+        await _await_port("127.0.0.1", emulator_port)
+    await controller.connect()
+    if not controller._connected:
+        raise RuntimeError("Could not connect to emulator")
 
     fastcs = FastCS(
         controller,
@@ -68,19 +89,44 @@ async def controller():
     fastcs_task = asyncio.create_task(fastcs.serve(interactive=False))
 
     # Wait for FastCS to have run initialise() & created attributes
-    max_iters = 100  # 10 seconds
-    for _ in range(max_iters):
-        if controller.sub_controllers:
-            break
-        await asyncio.sleep(0.1)
-    else:
-        raise RuntimeError("No subcontrollers created within 10s of FastCS serve")
+    async with asyncio.timeout(10):
+        await controller._initialised.wait()
 
     try:
         yield controller
     finally:
         fastcs_task.cancel()
-        await fastcs_task
+        # serve() may still be connecting, in which case the cancellation propagates.
+        with contextlib.suppress(asyncio.CancelledError):
+            await fastcs_task
+
+
+EXPECTED_INITIAL_ARRAYS = {
+    "blob": np.frombuffer(b"a blob of binary data", dtype=np.uint8),
+    "int_array": np.array([1, 1, 2, 3, 5, 8, 13], dtype=np.int32),
+    "bool_array": np.array([1, 1, 0, 1, 0, 0, 1, 1], dtype=np.uint8),
+    "double_array": np.array([1.414, 1.618, math.e, math.pi], dtype=np.float64),
+    "tuple": np.array(
+        [(1, 5.678, 1, "hiya", 5)],
+        dtype=[
+            ("e0", np.int32),
+            ("e1", np.float64),
+            ("e2", np.uint8),
+            ("e3", "<U512"),
+            ("e4", np.int32),
+        ],
+    ),
+    "struct": np.array(
+        [(42, math.pi, 1, "chillin'", 1)],
+        dtype=[
+            ("answer", np.int32),
+            ("pi", np.float64),
+            ("on_fire", np.uint8),
+            ("status", "<U512"),
+            ("mode", np.int32),
+        ],
+    ),
+}
 
 
 class TestInitialState:
@@ -111,44 +157,9 @@ class TestInitialState:
         )
         await attr.wait_for_predicate(lambda v: v.name == "three", timeout=2)
 
-    @pytest.mark.parametrize(
-        ("param", "expected_initial_value"),
-        [
-            ("blob", np.array([c for c in b"a blob of binary data"], dtype=np.uint8)),
-            ("int_array", np.array([1, 1, 2, 3, 5, 8, 13], dtype=np.int32)),
-            ("bool_array", np.array([1, 1, 0, 1, 0, 0, 1, 1], dtype=np.uint8)),
-            ("double_array", np.array([1.414, 1.618, math.e, math.pi], dtype=np.float64)),
-            (
-                "tuple",
-                np.array(
-                    [(1, 5.678, 1, "hiya", 5)],
-                    dtype=[
-                        ("e0", np.int32),
-                        ("e1", np.float64),
-                        ("e2", np.uint8),
-                        ("e3", "<U512"),
-                        ("e4", np.int32),
-                    ],
-                ),
-            ),
-            (
-                "struct",
-                np.array(
-                    [(42, math.pi, 1, "chillin'", 1)],
-                    dtype=[
-                        ("answer", np.int32),
-                        ("pi", np.float64),
-                        ("on_fire", np.uint8),
-                        ("status", "<U512"),
-                        ("mode", np.int32),
-                    ],
-                ),
-            ),
-        ],
-    )
-    async def test_attributes_created_for_array_datatype(
-        self, controller, emulator, param, expected_initial_value
-    ):
+    @pytest.mark.parametrize("param", EXPECTED_INITIAL_ARRAYS.keys())
+    async def test_attributes_created_for_array_datatype(self, controller, emulator, param):
+        expected_initial_value = EXPECTED_INITIAL_ARRAYS[param]
         attr: AttrR = typing.cast(
             AttrR, controller.sub_controllers["one_of_everything"].attributes[param]
         )
@@ -170,3 +181,24 @@ class TestInitialState:
     ):
         cmd_controller = controller.sub_controllers["one_of_everything"].sub_controllers[command]
         assert set(cmd_controller.attributes.keys()) == expected_attributes
+
+
+@pytest.mark.parametrize("controller", [SecopQuirks(asynchronous_updates=True)], indirect=True)
+class TestAsynchronousUpdates:
+    @pytest.mark.parametrize(
+        ("param", "expected_initial_value"),
+        [
+            ("double", 1.2345),
+            ("scaled", 42 * 47),
+            ("int", 73),
+            ("bool", True),
+            ("string", "hello"),
+        ],
+    )
+    async def test_initial_values_received_as_updates(
+        self, controller, emulator, param, expected_initial_value
+    ):
+        attr: AttrR = typing.cast(
+            AttrR, controller.sub_controllers["one_of_everything"].attributes[param]
+        )
+        await attr.wait_for_value(expected_initial_value, timeout=2)
@@ -0,0 +1,115 @@
+import asyncio
+from unittest.mock import AsyncMock, call, patch
+
+import pytest
+from fastcs.connections import IPConnectionSettings
+
+from fastcs_secop._connection import SecopConnection
+
+
+@pytest.fixture
+async def server():
+    received = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        while line := await reader.readline():
+            received.append(line.decode())
+            if line == b"describe\n":
+                writer.write(b"describing . " + b"x" * 100_000 + b"\n")
+            elif line.startswith(b"read "):
+                writer.write(b"reply " + line[len(b"read ") :].strip() + b" [1]\n")
+            elif line == b"activate\n":
+                writer.write(b"update some_module:some_accessible [2]\nactive\n")
+            await writer.drain()
+        writer.close()
+
+    srv = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = srv.sockets[0].getsockname()[1]
+    async with srv:
+        yield IPConnectionSettings("127.0.0.1", port), received
+
+
+async def test_send_queries(server):
+    settings, received = server
+    connection = SecopConnection()
+    await connection.connect(settings)
+
+    with patch.object(connection, "log_event") as mock_log_event:
+        responses = await connection.send_queries(["read a:b\n", "read c:d\n"])
+
+    assert responses == ["reply a:b [1]\n", "reply c:d [1]\n"]
+    assert received == ["read a:b\n", "read c:d\n"]
+    assert mock_log_event.call_args_list == [
+        call("Received query response", query="read a:b", response="reply a:b [1]"),
+        call("Received query response", query="read c:d", response="reply c:d [1]"),
+    ]
+    await connection.close()
+
+
+async def test_receive_message(server):
+    settings, _ = server
+    connection = SecopConnection()
+    await connection.connect(settings)
+
+    await connection.send_command("activate\n")
+
+    with patch.object(connection, "log_event") as mock_log_event:
+        assert await connection.receive_message() == "update some_module:some_accessible [2]\n"
+        assert await connection.receive_message() == "active\n"
+
+    assert mock_log_event.call_args_list == [
+        call("Received message", message="update some_module:some_accessible [2]"),
+        call("Received message", message="active"),
+    ]
+    await connection.close()
+
+
+async def test_receive_long_message(server):
+    settings, _ = server
+    connection = SecopConnection()
+    await connection.connect(settings)
+
+    response = await connection.send_query("describe\n")
+
+    assert len(response) > 2**16
+    await connection.close()
+
+
+async def test_receive_updates(server):
+    settings, received = server
+    connection = SecopConnection()
+    await connection.connect(settings)
+
+    updates = connection.receive_updates()
+
+    assert await anext(updates) == ("update", "some_module:some_accessible", "[2]")
+    assert received == ["activate\n"]
+    await updates.aclose()
+    await connection.close()
+
+
+async def test_receive_updates_ignores_other_messages_until_closed():
+    connection = SecopConnection()
+    messages = [
+        "active\n",
+        "update a:b [1]\n",
+        "pong 1\n",
+        'error_update c:d ["HardwareError", "sensor broken", {}]\n',
+        "update c:d [2]\n",
+        "",
+    ]
+
+    with (
+        patch.object(connection, "send_command", AsyncMock()),
+        patch.object(connection, "receive_message", AsyncMock(side_effect=messages)),
+    ):
+        updates = connection.receive_updates()
+        assert await anext(updates) == ("update", "a:b", "[1]")
+        assert await anext(updates) == (
+            "error_update",
+            "c:d",
+            '["HardwareError", "sensor broken", {}]',
+        )
+        assert await anext(updates) == ("update", "c:d", "[2]")
+        with pytest.raises(ConnectionError):
+            await anext(updates)
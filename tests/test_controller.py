@@ -39,19 +39,28 @@ async def test_reconnect_fails(controller):
         assert not controller._connected
 
 
-async def test_ping_happy_path(controller):
+@pytest.mark.parametrize("data_report", [" [null, {}]", ""])
+async def test_ping_happy_path(controller, data_report):
     async def ping_response(inp):
         await asyncio.sleep(0)
-        return f"pong {inp[5:]}\n"
+        return f"pong {inp[5:-1]}{data_report}\n"
 
     with patch.object(controller._connection, "send_query", ping_response):
         await controller.ping()
+        await controller.ping()
 
 
-async def test_ping_bad_response(controller):
+@pytest.mark.parametrize(
+    "response",
+    [
+        "blah_blah",
+        "pong 10 [null, {}]\n",  # Reply to some other ping
+    ],
+)
+async def test_ping_bad_response(controller, response):
     with (
         pytest.raises(SecopError, match=r"Unexpected response to SECoP ping .*"),
-        patch.object(controller._connection, "send_query", AsyncMock(return_value="blah_blah")),
+        patch.object(controller._connection, "send_query", AsyncMock(return_value=response)),
     ):
         await controller.ping()
 
@@ -79,6 +88,14 @@ async def test_check_idn():
         await controller.check_idn()
 
 
+async def test_deactivate(controller):
+    with patch.object(
+        controller._connection, "send_query", AsyncMock(return_value="inactive\n")
+    ) as mock_send_query:
+        await controller.deactivate()
+        mock_send_query.assert_awaited_once_with("deactivate\n")
+
+
 async def test_create_modules():
     controller = SecopController(
         SecopControllerSettings(
@@ -87,7 +104,7 @@ async def test_create_modules():
         )
     )
     controller._connection = AsyncMock()
-    controller._connection.send_query.return_value = (
+    descriptor = (
         "describing . "
         + orjson.dumps(
             {
@@ -103,12 +120,43 @@ async def test_create_modules():
         + "\n"
     )
 
-    await controller._create_modules()
+    await controller._create_modules(descriptor)
     assert "a_cool_module" in controller.sub_controllers
     assert "another_cool_module" in controller.sub_controllers
     assert "a_skipped_module" not in controller.sub_controllers
 
 
+async def test_initialise_with_module_named_poll():
+    controller = SecopController(
+        SecopControllerSettings(IPConnectionSettings("127.0.0.1", 0)),
+    )
+    describing = (
+        "describing . "
+        + orjson.dumps(
+            {
+                "description": "some description",
+                "equipment_id": "some equipment id",
+                "modules": {"poll": {"accessibles": {}}},
+            }
+        ).decode()
+        + "\n"
+    )
+    with (
+        patch.object(controller._connection, "connect", AsyncMock()),
+        patch.object(controller, "check_idn", AsyncMock()),
+        patch.object(
+            controller._connection,
+            "send_queries",
+            AsyncMock(return_value=["inactive\n", describing]),
+        ),
+        patch.object(controller, "_create_reconnect_task", AsyncMock()),
+    ):
+        await controller.initialise()
+
+    assert "poll" in controller.sub_controllers
+    assert "_poll" in controller.scan_methods
+
+
 async def test_create_modules_bad_description():
     controller = SecopController(
         SecopControllerSettings(
@@ -117,10 +165,9 @@ async def test_create_modules_bad_description():
         )
     )
     controller._connection = AsyncMock()
-    controller._connection.send_query.return_value = "a huge pile of nonsense\n"
 
     with pytest.raises(SecopError):
-        await controller._create_modules()
+        await controller._create_modules("a huge pile of nonsense\n")
 
 
 async def test_secop_module_controller_initialise():
@@ -147,6 +194,10 @@ async def test_secop_module_controller_initialise():
     assert controller.attributes["raw_accessible"].dtype is str
     assert "skipped_accessible" not in controller.attributes
 
+    # Polling is done in one batch by SecopController, not per-attribute by FastCS
+    assert controller.attributes["normal_accessible"].io_ref.update_period is None
+    assert controller.attributes["raw_accessible"].io_ref.update_period is None
+
 
 async def test_cannot_connect_to_controller_at_startup():
     controller = SecopController(
@@ -250,3 +301,80 @@ async def test_command_controller_execute_raw_args_and_result():
 
     connection.send_query.assert_awaited_once_with("do some_module:some_command [13]\n")
     assert controller.result.get() == "[42]"
+
+
+@pytest.mark.parametrize("connection_error", [True, False])
+async def test_receive_updates(connection_error):
+    controller = SecopController(
+        SecopControllerSettings(IPConnectionSettings("127.0.0.1", 0)),
+    )
+
+    async def receive_updates():
+        await asyncio.sleep(0)
+        yield "update", "some_module:some_accessible", "[42]"
+        yield "error_update", "some_module:some_accessible", '["HardwareError", "broken", {}]'
+        if connection_error:
+            raise ConnectionError
+
+    with (
+        patch.object(controller._update_connection, "connect", AsyncMock()) as mock_connect,
+        patch.object(controller._update_connection, "receive_updates", receive_updates),
+        patch.object(controller._update_connection, "close", AsyncMock()) as mock_close,
+        patch.object(controller._poller, "apply", AsyncMock()) as mock_apply,
+        patch.object(controller._poller, "apply_error") as mock_apply_error,
+    ):
+        await controller._receive_updates()  # No exception thrown
+        mock_connect.assert_awaited_once()
+        mock_apply.assert_awaited_once_with("some_module:some_accessible", "[42]")
+        mock_apply_error.assert_called_once_with(
+            "some_module:some_accessible", '["HardwareError", "broken", {}]'
+        )
+        mock_close.assert_awaited_once()
+
+
+@pytest.mark.parametrize("update_task", [True, False])
+async def test_disconnect(update_task):
+    controller = SecopController(
+        SecopControllerSettings(IPConnectionSettings("127.0.0.1", 0)),
+    )
+    if update_task:
+        controller._update_task = asyncio.create_task(asyncio.sleep(100))
+
+    with patch.object(controller._connection, "close", AsyncMock()) as mock_close:
+        await controller.disconnect()
+
+    mock_close.assert_awaited_once()
+    if controller._update_task is not None:
+        assert controller._update_task.cancelled()
+
+
+@pytest.mark.parametrize("asynchronous_updates", [True, False])
+async def test_initialise_update_mode(asynchronous_updates):
+    controller = SecopController(
+        SecopControllerSettings(
+            IPConnectionSettings("127.0.0.1", 0),
+            quirks=SecopQuirks(asynchronous_updates=asynchronous_updates),
+        ),
+    )
+    with (
+        patch.object(controller._connection, "connect", AsyncMock()),
+        patch.object(controller, "check_idn", AsyncMock()),
+        patch.object(
+            controller._connection,
+            "send_queries",
+            AsyncMock(return_value=["inactive\n", "describing . {}\n"]),
+        ),
+        patch.object(controller, "_create_modules", AsyncMock()) as mock_create_modules,
+        patch.object(controller, "_create_reconnect_task", AsyncMock()),
+        patch.object(controller, "_receive_updates", AsyncMock()) as mock_receive_updates,
+    ):
+        await controller.initialise()
+        await asyncio.sleep(0)
+
+        mock_create_modules.assert_awaited_once_with("describing . {}\n")
+        assert controller._initialised.is_set()
+        assert ("_poll" in controller.scan_methods) != asynchronous_updates
+        assert mock_receive_updates.await_count == int(asynchronous_updates)
+
+    if asynchronous_updates:
+        controller._update_task.cancel()
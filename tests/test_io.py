@@ -1,4 +1,5 @@
 import enum
+from logging import DEBUG, ERROR
 from unittest.mock import AsyncMock, patch
 
 import numpy as np
@@ -7,11 +8,16 @@ from fastcs.attributes import AttrRW
 from fastcs.connections import IPConnection
 
 from fastcs_secop import SecopError
+from fastcs_secop._connection import SecopConnection
 from fastcs_secop._io import (
     SecopAttributeIO,
+    SecopAttributeIORef,
+    SecopBatchPoller,
     SecopRawAttributeIO,
+    SecopRawAttributeIORef,
     decode,
     encode,
+    make_decoder,
     secop_change,
     secop_read,
 )
@@ -23,7 +29,8 @@ async def test_read_accessible_success():
     mock_connection.send_query.return_value = "reply some_module:some_accessible {'blah': 'blah'}\n"
 
     await secop_read(
-        connection=mock_connection, module_name="some_module", accessible_name="some_accessible"
+        connection=mock_connection,
+        io_ref=SecopRawAttributeIORef(module_name="some_module", accessible_name="some_accessible"),
     )
 
     mock_connection.send_query.assert_awaited_once_with("read some_module:some_accessible\n")
@@ -37,7 +44,10 @@ async def test_read_accessible_failure():
 
     with pytest.raises(SecopError):
         await secop_read(
-            connection=mock_connection, module_name="some_module", accessible_name="some_accessible"
+            connection=mock_connection,
+            io_ref=SecopRawAttributeIORef(
+                module_name="some_module", accessible_name="some_accessible"
+            ),
         )
 
     mock_connection.send_query.assert_awaited_once_with("read some_module:some_accessible\n")
@@ -51,8 +61,7 @@ async def test_change_accessible_success():
 
     await secop_change(
         connection=mock_connection,
-        module_name="some_module",
-        accessible_name="some_accessible",
+        io_ref=SecopRawAttributeIORef(module_name="some_module", accessible_name="some_accessible"),
         encoded_value="{'blah': 'blah'}",
     )
 
@@ -70,8 +79,9 @@ async def test_change_accessible_failure():
     with pytest.raises(SecopError):
         await secop_change(
             connection=mock_connection,
-            module_name="some_module",
-            accessible_name="some_accessible",
+            io_ref=SecopRawAttributeIORef(
+                module_name="some_module", accessible_name="some_accessible"
+            ),
             encoded_value="{'blah': 'blah'}",
         )
 
@@ -167,30 +177,30 @@ def test_decode(decoded, datainfo, encoded):
         assert result == decoded
 
 
-def test_encode_unknown_type():
-    with pytest.raises(SecopError):
-        encode(5, {"type": "some_random_type_that_doesn't exist"})
+def test_make_decoder_reused_for_several_values():
+    datainfo = {"type": "struct", "members": {"a": {"type": "int"}, "b": {"type": "double"}}}
+    decoder = make_decoder(datainfo, AttrRW(secop_datainfo_to_fastcs_dtype(datainfo)))
 
+    first = decoder('[{"a": 1, "b": 2.5}, {}]')
+    second = decoder('[{"a": 3, "b": 4.5}, {}]')
 
-@pytest.mark.parametrize(
-    ("io_cls", "expected"),
-    [
-        (SecopAttributeIO, 123.456),
-        (SecopRawAttributeIO, "123.456"),
-    ],
-)
-async def test_attribute_io_update(io_cls, expected):
-    connection = AsyncMock(spec=IPConnection)
-    attr = AsyncMock(spec=AttrRW)
-    io = io_cls(connection=connection)
+    assert first.tolist() == [(1, 2.5)]
+    assert second.tolist() == [(3, 4.5)]
 
-    with (
-        patch("fastcs_secop._io.secop_read", return_value='[123.456, {"t": 5, "e": 7}]'),
-        patch("fastcs_secop._io.decode", return_value=123.456),
-    ):
-        await io.update(attr)
 
-    attr.update.assert_awaited_once_with(expected)
+def test_decode_struct_with_omitted_member():
+    datainfo = {
+        "type": "struct",
+        "members": {"a": {"type": "int"}, "b": {"type": "double"}},
+        "optional": ["b"],
+    }
+    result = decode('[{"a": 1}, {}]', datainfo, AttrRW(secop_datainfo_to_fastcs_dtype(datainfo)))
+    assert result.tolist() == [(1, 0.0)]
+
+
+def test_encode_unknown_type():
+    with pytest.raises(SecopError):
+        encode(5, {"type": "some_random_type_that_doesn't exist"})
 
 
 @pytest.mark.parametrize(
@@ -233,3 +243,155 @@ async def test_attribute_io_send_fails(io_cls, error):
         patch("fastcs_secop._io.encode", return_value="123.456"),
     ):
         await io.send(attr, 123.456)
+
+
+@pytest.fixture
+def polled_attrs():
+    int_attr = AsyncMock(spec=AttrRW)
+    int_attr.io_ref = SecopAttributeIORef(
+        module_name="mod", accessible_name="int", datainfo={"type": "int"}
+    )
+    raw_attr = AsyncMock(spec=AttrRW)
+    raw_attr.io_ref = SecopRawAttributeIORef(module_name="mod", accessible_name="raw")
+    return int_attr, raw_attr
+
+
+async def test_batch_poller_poll(polled_attrs):
+    int_attr, raw_attr = polled_attrs
+    connection = AsyncMock(spec=SecopConnection)
+    connection.send_queries.return_value = [
+        'reply mod:raw [[1, 2], {"t": 5}]\n',
+        'reply mod:int [42, {"t": 5}]\n',
+    ]
+    poller = SecopBatchPoller(connection=connection)
+    poller.add(int_attr)
+    poller.add(raw_attr)
+
+    await poller.poll()
+
+    connection.send_queries.assert_awaited_once_with(["read mod:int\n", "read mod:raw\n"])
+    int_attr.update.assert_awaited_once_with(42)
+    raw_attr.update.assert_awaited_once_with("[1,2]")
+
+
+async def test_batch_poller_falls_back_to_individual_reads(polled_attrs):
+    int_attr, raw_attr = polled_attrs
+    connection = AsyncMock(spec=SecopConnection)
+    connection.send_queries.return_value = [
+        'reply mod:int [42, {"t": 5}]\n',
+        'reply mod:not_polled [1, {"t": 5}]\n',
+    ]
+    poller = SecopBatchPoller(connection=connection)
+    poller.add(int_attr)
+    poller.add(raw_attr)
+
+    with patch("fastcs_secop._io.secop_read", return_value='[[3], {"t": 6}]') as mock_read:
+        await poller.poll()
+
+    mock_read.assert_awaited_once_with(connection, raw_attr.io_ref)
+    int_attr.update.assert_awaited_once_with(42)
+    raw_attr.update.assert_awaited_once_with("[3]")
+
+
+async def test_batch_poller_poll_continues_after_bad_accessible(polled_attrs):
+    int_attr, raw_attr = polled_attrs
+    connection = AsyncMock(spec=SecopConnection)
+    connection.send_queries.return_value = [
+        'reply mod:int ["not an int", {"t": 5}]\n',
+        'reply mod:not_polled [1, {"t": 5}]\n',
+    ]
+    int_attr.update.side_effect = ValueError
+    poller = SecopBatchPoller(connection=connection)
+    poller.add(raw_attr)
+    poller.add(int_attr)
+
+    with (
+        patch("fastcs_secop._io.secop_read", side_effect=SecopError),
+        patch("fastcs_secop._io.logger") as mock_logger,
+    ):
+        await poller.poll()
+
+    int_attr.update.assert_awaited_once()
+    raw_attr.update.assert_not_awaited()
+    assert [c.args[2] for c in mock_logger.log.call_args_list] == ["mod:int", "mod:raw"]
+
+
+async def test_batch_poller_poll_error_read_is_not_read_again(polled_attrs):
+    int_attr, raw_attr = polled_attrs
+    connection = AsyncMock(spec=SecopConnection)
+    connection.send_queries.return_value = [
+        'reply mod:int [42, {"t": 5}]\n',
+        'error_read mod:raw ["HardwareError", "sensor broken", {}]\n',
+    ]
+    poller = SecopBatchPoller(connection=connection)
+    poller.add(int_attr)
+    poller.add(raw_attr)
+
+    with patch("fastcs_secop._io.logger") as mock_logger:
+        await poller.poll()
+        await poller.poll()
+
+    connection.send_query.assert_not_awaited()
+    raw_attr.update.assert_not_awaited()
+    assert int_attr.update.await_count == 2
+    assert mock_logger.log.call_args.args[2] == "mod:raw"
+    assert "sensor broken" in str(mock_logger.log.call_args.args[4])
+
+
+async def test_batch_poller_poll_nothing():
+    connection = AsyncMock(spec=SecopConnection)
+    poller = SecopBatchPoller(connection=connection)
+
+    await poller.poll()
+
+    connection.send_queries.assert_not_awaited()
+
+
+async def test_batch_poller_apply(polled_attrs):
+    int_attr, raw_attr = polled_attrs
+    int_attr.update.side_effect = [None, ValueError]
+    poller = SecopBatchPoller(connection=AsyncMock(spec=SecopConnection))
+    poller.add(int_attr)
+    poller.add(raw_attr)
+
+    await poller.apply("mod:int", '[42, {"t": 5}]')
+    await poller.apply("mod:raw", '[[1, 2], {"t": 5}]')
+    await poller.apply("mod:not_polled", '[1, {"t": 5}]')
+    await poller.apply("mod:int", '[43, {"t": 6}]')  # Update fails, but is not raised
+
+    assert int_attr.update.await_count == 2
+    raw_attr.update.assert_awaited_once_with("[1,2]")
+
+
+def test_batch_poller_apply_error(polled_attrs):
+    int_attr, _ = polled_attrs
+    poller = SecopBatchPoller(connection=AsyncMock(spec=SecopConnection))
+    poller.add(int_attr)
+
+    with (
+        patch("fastcs_secop._io.time.monotonic", side_effect=[100.0, 100.5]),
+        patch("fastcs_secop._io.logger") as mock_logger,
+    ):
+        poller.apply_error("mod:int", '["HardwareError", "sensor broken", {}]')
+        poller.apply_error("mod:not_polled", '["HardwareError", "sensor broken", {}]')
+        poller.apply_error("mod:int", '["HardwareError", "sensor broken", {}]')
+
+    assert [c.args[0] for c in mock_logger.log.call_args_list] == [ERROR, DEBUG]
+    assert "sensor broken" in str(mock_logger.log.call_args.args[4])
+    mock_logger.debug.assert_called_once()
+
+
+async def test_batch_poller_apply_limits_error_logs(polled_attrs):
+    int_attr, _ = polled_attrs
+    int_attr.update.side_effect = ValueError
+    poller = SecopBatchPoller(connection=AsyncMock(spec=SecopConnection))
+    poller.add(int_attr)
+
+    with (
+        patch("fastcs_secop._io.time.monotonic", side_effect=[100.0, 100.5, 101.5]),
+        patch("fastcs_secop._io.logger") as mock_logger,
+    ):
+        for _ in range(3):
+            await poller.apply("mod:int", '[42, {"t": 5}]')
+
+    assert [c.args[0] for c in mock_logger.log.call_args_list] == [ERROR, DEBUG, ERROR]
@@ -17,6 +17,8 @@ from fastcs_secop._util import (
         ("%.99f", 99),
         ("%.5g", None),
         ("%.5e", None),
+        ("%.f", None),
+        ("%.3lf", None),
         (None, None),
     ],
 )
@@ -78,3 +80,19 @@ def test_secop_datainfo_to_fastcs_dtype_raw():
     assert isinstance(
         secop_datainfo_to_fastcs_dtype({"type": "some_type_that_does_not_exist"}, raw=True), String
     )
+
+
+@pytest.mark.parametrize(
+    "datainfo",
+    [
+        {"type": "double", "unit": "K", "min": 0.0, "max": 300.0, "fmtstr": "%.3f"},
+        {"type": "int", "unit": "mm", "min": 0, "max": 10},
+        {"type": "bool"},
+        {"type": "string"},
+        {"type": "enum", "members": {"idle": 100, "busy": 300}},
+    ],
+)
+def test_secop_datainfo_to_fastcs_dtype_shares_identical_dtypes(datainfo):
+    assert secop_datainfo_to_fastcs_dtype(dict(datainfo)) is secop_datainfo_to_fastcs_dtype(
+        dict(datainfo)
+    )